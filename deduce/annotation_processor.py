@@ -4,6 +4,8 @@ import docdeid as dd
 from docdeid import AnnotationSet
 from frozendict import frozendict
 
+_PATIENT_PERSON_TAGS = frozenset({"patient", "persoon"})
+
 
 class DeduceMergeAdjacentAnnotations(dd.process.MergeAdjacentAnnotations):
     """Merge adjacent tags, according to deduce logic: adjacent annotations with mixed
@@ -23,10 +25,9 @@ class DeduceMergeAdjacentAnnotations(dd.process.MergeAdjacentAnnotations):
             ``True`` if tags match, ``False`` otherwise.
         """
 
-        return (left_tag == right_tag) or {left_tag, right_tag} == {
-            "patient",
-            "persoon",
-        }
+        return (left_tag == right_tag) or (
+            left_tag in _PATIENT_PERSON_TAGS and right_tag in _PATIENT_PERSON_TAGS
+        )
 
     def _adjacent_annotations_replacement(
         self,
@@ -97,7 +98,9 @@ class PersonAnnotationConverter(dd.process.AnnotationProcessor):
                 tag="patient" if "patient" in annotation.tag else "persoon",
             )
             for annotation in new_annotations
-            if ("pseudo" not in annotation.tag and len(annotation.text.strip()) != 0)
+            if "pseudo" not in annotation.tag
+            and annotation.text
+            and not annotation.text.isspace()
         )
 
 
@@ -105,7 +108,7 @@ class RemoveAnnotations(dd.process.AnnotationProcessor):
     """Removes all annotations with corresponding tags."""
 
     def __init__(self, tags: list[str]) -> None:
-        self.tags = tags
+        self.tags = set(tags)
 
     def process_annotations(
         self, annotations: AnnotationSet, text: str
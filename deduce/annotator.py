@@ -12,6 +12,8 @@ from deduce.utils import str_match
 
 warnings.simplefilter(action="default")
 
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+
 _DIRECTION_MAP = {
     "left": {
         "attr": "previous",
@@ -55,15 +57,14 @@ class _PatternPositionMatcher:  # pylint: disable=R0903
         if func == "re_match":
             return re.match(value, kwargs.get("token").text) is not None
         if func == "is_initials":
-            return (
-                len(kwargs.get("token").text) <= 4
-                and kwargs.get("token").text.isupper()
-            ) == value
+            text = kwargs.get("token").text
+            return (len(text) <= 4 and text.isupper()) == value
         if func == "like_name":
+            text = kwargs.get("token").text
             return (
-                len(kwargs.get("token").text) >= 3
-                and kwargs.get("token").text.istitle()
-                and not any(ch.isdigit() for ch in kwargs.get("token").text)
+                len(text) >= 3
+                and text.istitle()
+                and not any(ch.isdigit() for ch in text)
             ) == value
         if func == "lookup":
             return kwargs.get("token").text in kwargs.get("ds")[value]
@@ -256,18 +257,20 @@ class ContextAnnotator(TokenPatternAnnotator):
         direction = context_pattern["direction"]
         skip = set(context_pattern.get("skip", []))
 
+        attr = _DIRECTION_MAP[direction]["attr"]
+        order = _DIRECTION_MAP[direction]["order"]
+        get_start_token = _DIRECTION_MAP[direction]["start_token"]
+        pre_tag = context_pattern["pre_tag"]
+
         for annotation in annotations.copy():
 
-            tag = list(_DIRECTION_MAP[direction]["order"](annotation.tag.split("+")))[
-                -1
-            ]
+            tag = list(order(annotation.tag.split("+")))[-1]
 
-            if tag not in context_pattern["pre_tag"]:
+            if tag not in pre_tag:
                 continue
 
-            attr = _DIRECTION_MAP[direction]["attr"]
             start_token = self._get_chained_token(
-                _DIRECTION_MAP[direction]["start_token"](annotation), attr, skip
+                get_start_token(annotation), attr, skip
             )
             new_annotation = self._match_sequence(
                 text,
@@ -278,9 +281,7 @@ class ContextAnnotator(TokenPatternAnnotator):
             )
 
             if new_annotation:
-                left_ann, right_ann = _DIRECTION_MAP[direction]["order"](
-                    (annotation, new_annotation)
-                )
+                left_ann, right_ann = order((annotation, new_annotation))
 
                 merged_annotation = dd.Annotation(
                     text=text[left_ann.start_char : right_ann.end_char],
@@ -300,8 +301,8 @@ class ContextAnnotator(TokenPatternAnnotator):
     def _annotate(self, text: str, annotations: dd.AnnotationSet) -> dd.AnnotationSet:
         """
         Does the annotation, by calling _apply_context_pattern, and then optionally
-        recursing. Also keeps track of the (un)changed annotations, so they are not
-        repeatedly processed.
+        repeating on the annotations that changed. Also keeps track of the
+        (un)changed annotations, so they are not repeatedly processed.
 
         Args:
             text: The input text.
@@ -311,24 +312,27 @@ class ContextAnnotator(TokenPatternAnnotator):
             An extended set of annotations, based on the patterns provided.
         """
 
-        original_annotations = annotations.copy()
+        result = dd.AnnotationSet()
 
-        for context_pattern in self.pattern:
-            annotations = self._apply_context_pattern(
-                text, annotations, context_pattern
-            )
+        while True:
 
-        if self.iterative:
+            original_annotations = annotations.copy()
+
+            for context_pattern in self.pattern:
+                annotations = self._apply_context_pattern(
+                    text, annotations, context_pattern
+                )
+
+            if not self.iterative:
+                return annotations
 
             changed = dd.AnnotationSet(annotations.difference(original_annotations))
-            annotations = dd.AnnotationSet(
-                annotations.intersection(original_annotations)
-            )
+            result.update(annotations.intersection(original_annotations))
 
-            if changed:
-                annotations.update(self._annotate(text, changed))
+            if not changed:
+                return result
 
-        return annotations
+            annotations = changed
 
     def annotate(self, doc: dd.Document) -> list[dd.Annotation]:
         """
@@ -549,17 +553,17 @@ class RegexpPseudoAnnotator(RegexpAnnotator):
         Returns: The previous word, or an empty string if at beginning of text.
         """
 
-        text = text[:char_index].strip()
-        result = ""
+        end = char_index
 
-        for ch in text[::-1]:
+        while end > 0 and text[end - 1].isspace():
+            end -= 1
 
-            if not self._is_word_char(ch):
-                break
+        start = end
 
-            result = ch + result
+        while start > 0 and self._is_word_char(text[start - 1]):
+            start -= 1
 
-        return result.strip()
+        return text[start:end]
 
     def _get_next_word(self, char_index: int, text: str) -> str:
         """
@@ -572,17 +576,17 @@ class RegexpPseudoAnnotator(RegexpAnnotator):
         Returns: The next word, or an empty string if at end of text.
         """
 
-        text = text[char_index:].strip()
-        result = ""
+        start = char_index
 
-        for ch in text:
+        while start < len(text) and text[start].isspace():
+            start += 1
 
-            if not self._is_word_char(ch):
-                break
+        end = start
 
-            result = result + ch
+        while end < len(text) and self._is_word_char(text[end]):
+            end += 1
 
-        return result
+        return text[start:end]
 
     def _validate_match(self, match: re.Match, doc: Document) -> bool:
         """
@@ -632,7 +636,7 @@ class BsnAnnotator(dd.process.Annotator):
 
     @staticmethod
     def _elfproef(bsn: str) -> bool:
-        if len(bsn) != 9 or (any(not char.isdigit() for char in bsn)):
+        if len(bsn) != 9 or not bsn.isdigit():
             raise ValueError(
                 "Elfproef for testing BSN can only be applied to strings with 9 digits."
             )
@@ -650,7 +654,7 @@ class BsnAnnotator(dd.process.Annotator):
         for match in self.bsn_regexp.finditer(doc.text):
 
             text = match.group(self.capture_group)
-            digits = re.sub(r"\D", "", text)
+            digits = _NON_DIGIT_PATTERN.sub("", text)
 
             start, end = match.span(self.capture_group)
 
@@ -700,8 +704,8 @@ class PhoneNumberAnnotator(dd.process.Annotator):
             digit_len_shift = 0
             left_index_shift = 0
             prefix_with_parens = match.group(1)
-            prefix_digits = "0" + re.sub(r"\D", "", match.group(3))
-            number_digits = re.sub(r"\D", "", match.group(4))
+            prefix_digits = "0" + _NON_DIGIT_PATTERN.sub("", match.group(3))
+            number_digits = _NON_DIGIT_PATTERN.sub("", match.group(4))
 
             # Trim parenthesis
             if prefix_with_parens.startswith("(") and not prefix_with_parens.endswith(
@@ -710,7 +714,7 @@ class PhoneNumberAnnotator(dd.process.Annotator):
                 left_index_shift = 1
 
             # Check max 1 hyphen
-            if len(re.findall("-", match.group(0))) > 1:
+            if match.group(0).count("-") > 1:
                 continue
 
             # Shift num digits for shorter numbers
@@ -79,7 +79,7 @@ def load_raw_itemset(path: Path) -> set[str]:
         items -= exceptions
 
     for sub_list_dir in sub_list_dirs:
-        items = items.union(load_raw_itemset(sub_list_dir))
+        items.update(load_raw_itemset(sub_list_dir))
 
     transform_config = optional_load_json(path / "transform.json")
 
@@ -13,20 +13,20 @@ class DeduceRedactor(dd.process.SimpleRedactor):
 
     def redact(self, text: str, annotations: dd.AnnotationSet) -> str:
         annotations_to_intext_replacement = {}
+        patient_replacement = f"{self.open_char}PATIENT{self.close_char}"
 
         for tag, annotation_group in self._group_annotations_by_tag(
             annotations
         ).items():
             annotations_to_replacement_group: dict[dd.Annotation, str] = {}
+            tag_prefix = f"{self.open_char}{tag.upper()}-"
             counter = 1
 
             for annotation in sorted(
                 annotation_group, key=lambda a: a.get_sort_key(by=("end_char",))
             ):
                 if tag == "patient":
-                    annotations_to_intext_replacement[annotation] = (
-                        f"{self.open_char}" f"PATIENT" f"{self.close_char}"
-                    )
+                    annotations_to_intext_replacement[annotation] = patient_replacement
 
                 else:
                     match = False
@@ -47,13 +47,9 @@ class DeduceRedactor(dd.process.SimpleRedactor):
                             break
 
                     if not match:
-                        annotations_to_replacement_group[annotation] = (
-                            f"{self.open_char}"
-                            f"{annotation.tag.upper()}"
-                            f"-"
-                            f"{counter}"
-                            f"{self.close_char}"
-                        )
+                        annotations_to_replacement_group[
+                            annotation
+                        ] = f"{tag_prefix}{counter}{self.close_char}"
 
                         counter += 1
 
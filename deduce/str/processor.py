@@ -42,20 +42,22 @@ class RemoveValues(StringModifier):
 
     def __init__(self, filter_values: list[str]) -> None:
         self.filter_values = filter_values
-
-    def process(self, item: str) -> str:
-        for filter_value in self.filter_values:
-            item = re.sub(
+        self._filter_patterns = [
+            re.compile(
                 r"(^"
                 + filter_value
                 + r" | "
                 + filter_value
                 + r" | "
                 + filter_value
-                + r"$)",
-                "",
-                item,
+                + r"$)"
             )
+            for filter_value in filter_values
+        ]
+
+    def process(self, item: str) -> str:
+        for filter_pattern in self._filter_patterns:
+            item = filter_pattern.sub("", item)
 
         return item
 
@@ -1,7 +1,9 @@
+import functools
 import importlib
 import inspect
 import json
 import re
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -32,6 +34,7 @@ def str_match(str_1: str, str_2: str, max_edit_distance: Optional[int] = None) -
     return str_1 == str_2
 
 
+@functools.lru_cache(maxsize=None)
 def class_for_name(module_name: str, class_name: str) -> type:
     """
     Will import and return the class by name.
@@ -48,6 +51,21 @@ def class_for_name(module_name: str, class_name: str) -> type:
     return getattr(module, class_name)
 
 
+@functools.lru_cache(maxsize=None)
+def _init_param_names(cls: type) -> frozenset[str]:
+    """
+    Get the names of the parameters accepted by a class initializer.
+
+    Args:
+        cls: The class.
+
+    Returns:
+        The parameter names.
+    """
+
+    return frozenset(inspect.signature(cls).parameters)
+
+
 def initialize_class(cls: type, args: dict, extras: dict) -> object:
     """
     Initialize a class. Any arguments in args are passed to the class initializer. Any
@@ -63,7 +81,7 @@ def initialize_class(cls: type, args: dict, extras: dict) -> object:
         An instantiated class, with the relevant arguments and extras.
     """
 
-    cls_params = inspect.signature(cls).parameters
+    cls_params = _init_param_names(cls)
 
     for arg_name, arg in extras.items():
 
@@ -102,7 +120,7 @@ def has_overlap(intervals: list[tuple]) -> bool:
         True if there is any overlap between tuples, False otherwise.
     """
 
-    intervals_sorted = sorted(intervals, key=lambda tup: tup[0])
+    intervals_sorted = sorted(intervals, key=itemgetter(0))
 
     for i in range(len(intervals_sorted) - 1):
         if intervals_sorted[i][1] > intervals_sorted[i + 1][0]:
@@ -125,6 +143,28 @@ def repl_segments(s: str, matches: list[tuple]) -> list[list[str]]:
     Returns:
         A list of options that together segement the entire string, e.g. [["Prof.",
         "Professor"], [" "], ["Meester", "Mr."], [" Lievenslaan"]].
+
+    Raises:
+        RuntimeError: If any of the matches overlap.
+    """
+
+    return _repl_segments_sorted(s, sorted(matches, key=itemgetter(0)))
+
+
+def _repl_segments_sorted(s: str, matches: list[tuple]) -> list[list[str]]:
+    """
+    Same as `repl_segments`, but assumes the matches are sorted by start char, and
+    checks for overlap while segmenting.
+
+    Args:
+        s: The input string.
+        matches: A list of matches, sorted by start char.
+
+    Returns:
+        A list of options that together segment the entire string.
+
+    Raises:
+        RuntimeError: If any of the matches overlap.
     """
 
     if len(matches) == 0:
@@ -133,14 +173,20 @@ def repl_segments(s: str, matches: list[tuple]) -> list[list[str]]:
     choices = []
     pos = 0
 
-    for match in sorted(matches, key=lambda tup: tup[0]):
+    for match in matches:
+        if pos > match[0]:
+            raise RuntimeError(
+                "Cannot explode input string, because there is overlap "
+                "in the replacement mapping."
+            )
+
         if pos != match[0]:
             choices.append([s[pos : match[0]]])
 
         choices.append(match[2])
         pos = match[1]
 
-    if matches[-1][1] != len(s):
+    if pos != len(s):
         choices.append([s[pos : len(s)]])
 
     return choices
@@ -166,24 +212,36 @@ def str_variations(s: str, repl: dict[str, list[str]]) -> list[str]:
         A list containing all possible textual variations.
     """
 
+    return _str_variations(
+        s, {re.compile(pattern): options for pattern, options in repl.items()}
+    )
+
+
+def _str_variations(s: str, repl: dict[re.Pattern, list[str]]) -> list[str]:
+    """
+    Same as `str_variations`, but with the keys of `repl` already compiled.
+
+    Args:
+        s: The input string
+        repl: A mapping of compiled patterns to one or multiple replacements.
+
+    Returns:
+        A list containing all possible textual variations.
+    """
+
     matches = []
 
-    for pattern in repl:
-        for m in re.finditer(pattern, s):
-            matches.append((m.span()[0], m.span()[1], repl[pattern]))
+    for pattern, options in repl.items():
+        for m in pattern.finditer(s):
+            matches.append((m.span()[0], m.span()[1], options))
 
     if len(matches) == 0:
         return [s]
 
-    if has_overlap(matches):
-        raise RuntimeError(
-            "Cannot explode input string, because there is overlap "
-            "in the replacement mapping."
-        )
-
+    matches.sort(key=itemgetter(0))
     variations = [""]
 
-    for segment in repl_segments(s, matches):
+    for segment in _repl_segments_sorted(s, matches):
         new_variations = []
         for choice in segment:
             for prefix in variations:
@@ -210,10 +268,13 @@ def apply_transform(items: set[str], transform_config: dict) -> set[str]:
 
     for _, transform in transforms.items():
 
+        compiled_transform = {
+            re.compile(pattern): options for pattern, options in transform.items()
+        }
         to_add = []
 
         for item in items:
-            to_add += str_variations(item, transform)
+            to_add += _str_variations(item, compiled_transform)
 
         items.update(to_add)
 
@@ -235,7 +296,7 @@ def optional_load_items(path: Path) -> Optional[set[str]]:
 
     try:
         with open(path, "r", encoding="utf-8") as file:
-            items = {line.strip() for line in file.readlines()}
+            items = {line.strip() for line in file}
     except FileNotFoundError:
         return None
 
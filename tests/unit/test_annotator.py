@@ -768,6 +768,7 @@ class TestRegexpPseudoAnnotator:
         assert r._get_previous_word(8, "patient 12 jaar") == "patient"
         assert r._get_previous_word(7, "(sinds 12 jaar)") == "sinds"
         assert r._get_previous_word(11, "patient is 12 jaar)") == "is"
+        assert r._get_previous_word(12, "patient is \n 12 jaar)") == "is"
 
     def test_get_next(self):
 
@@ -777,6 +778,7 @@ class TestRegexpPseudoAnnotator:
         assert r._get_next_word(7, "12 jaar, geleden") == ""
         assert r._get_next_word(7, "12 jaar geleden") == "geleden"
         assert r._get_next_word(7, "12 jaar geleden geopereerd") == "geleden"
+        assert r._get_next_word(7, "12 jaar \n geleden") == "geleden"
 
     def test_validate_match(self, regexp_pseudo_doc):
 
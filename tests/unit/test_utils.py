@@ -150,6 +150,14 @@ class TestStrVariations:
 
         assert segments == [["Prof.", "Professor"], [" Lieflant"], ["laan", "ln"]]
 
+    def test_repl_segments_overlap(self):
+
+        s = "abcdef"
+        matches = [(0, 3, ["x"]), (2, 4, ["y"])]
+
+        with pytest.raises(RuntimeError):
+            _ = utils.repl_segments(s, matches)
+
     def test_str_variations_no_matches(self):
 
         s = "Prof. Lieflantlaan"
@@ -218,6 +226,19 @@ class TestStrVariations:
 
         assert transformed_items == {"den Burg", "Burg", "Rotterdam"}
 
+    def test_apply_transform_regexp(self):
+
+        items = {"van Bevanstraat", "Bevanstraat"}
+        transform = {"transforms": {"prefix": {"^van": ["Van", "van"]}}}
+
+        transformed_items = utils.apply_transform(items, transform)
+
+        assert transformed_items == {
+            "van Bevanstraat",
+            "Van Bevanstraat",
+            "Bevanstraat",
+        }
+
     def test_apply_transform_no_strip_lines(self):
 
         items = {"den Burg", "Rotterdam"}